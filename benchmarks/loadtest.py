@@ -0,0 +1,530 @@
+"""
+Load test lokal: jalankan app di bawah gunicorn lalu kirim traffic campuran ke /encrypt.
+
+Harness ini menjalankan ``gunicorn app:app`` di port lokal, lalu sejumlah client
+(thread, closed-loop) memilih skenario secara acak sesuai bobotnya: teks kecil
+di semua cipher, upload file, dan sesekali upload ``super`` besar (~42MB,
+ukuran terbesar yang round-trip /download-nya muat di MAX_CONTENT_LENGTH). Hasilnya berupa JSON:
+latency p50/p95/p99 per skenario dan total, throughput, error rate, serta RSS
+server (master + worker) sepanjang waktu, supaya angka kapasitas per ukuran
+host bisa dibandingkan antar rilis.
+
+Butuh gunicorn (``pip install gunicorn``, Linux/macOS). psutil opsional;
+tanpa psutil RSS dibaca dari /proc (Linux).
+
+Contoh:
+    python benchmarks/loadtest.py --duration 60 --concurrency 16 --workers 4 -o load.json
+    python benchmarks/loadtest.py --mix text --cipher hill --cipher vigenere --sizes 64,1K,64K
+    python benchmarks/loadtest.py --mix-file my_mix.json
+
+Batas yang diketahui: hasil upload ``max`` (64MB) tidak bisa dikirim balik ke
+/download karena body base64-nya melebihi MAX_CONTENT_LENGTH, jadi skenario
+``max`` dengan ``download: true`` selalu gagal. Pakai ``max-download`` untuk
+round-trip, atau ``max`` tanpa download untuk mengukur upload terbesar.
+
+Format --mix-file: list skenario, mis.
+    [{"cipher": "vigenere", "size": "1K", "weight": 10},
+     {"cipher": "super", "size": "max", "file": true, "weight": 0.1}]
+"""
+import argparse
+import base64
+import json
+import os
+import platform
+import random
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import uuid
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CIPHERS = ['vigenere', 'autokey', 'playfair', 'affine', 'hill', 'extended_vigenere', 'super']
+
+# sama dengan app.config['MAX_CONTENT_LENGTH']; "max" = batas ini dikurangi
+# ruang untuk header multipart dan field form lain
+MAX_CONTENT_LENGTH = 64 * 1024 * 1024
+_MULTIPART_MARGIN = 64 * 1024
+
+# /download menerima hasil sebagai base64 dalam form urlencoded (+ dan / jadi
+# %2B/%2F), jadi body-nya ~4/3 x ~17/16 ukuran hasil dan upload "max" tidak
+# bisa di-download ulang (413). "max-download" = upload terbesar yang
+# round-trip /download-nya masih muat di MAX_CONTENT_LENGTH (faktor 9/8 sebagai
+# batas aman untuk ekspansi urlencode).
+_MAX_DOWNLOAD_SIZE = (MAX_CONTENT_LENGTH - _MULTIPART_MARGIN) * 3 // 4 * 8 // 9
+
+# sama dengan app.BINARY_SUPPORTED; tidak di-import supaya client tidak memuat Flask
+BINARY_SUPPORTED = {'extended_vigenere', 'super'}
+
+_FORM = {'key': 'KEY', 'key2': 'TRANSPOSE'}
+
+
+def parse_size(value) -> int:
+    """
+    '64' -> 64, '1K' -> 1024, '16M' -> 16 MiB, 'max' -> batas upload,
+    'max-download' -> upload terbesar yang hasilnya masih bisa lewat /download.
+    """
+    if isinstance(value, int):
+        return value
+    s = str(value).strip().upper()
+    if s == 'MAX':
+        return MAX_CONTENT_LENGTH - _MULTIPART_MARGIN
+    if s == 'MAX-DOWNLOAD':
+        return _MAX_DOWNLOAD_SIZE
+    units = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+    if s and s[-1] in units:
+        return int(float(s[:-1]) * units[s[-1]])
+    return int(s)
+
+
+def _scenario(cipher, size, weight, file=False, download=False):
+    return {
+        'name': f"{cipher}:{'file' if file else 'text'}:{size}" + (':download' if download else ''),
+        'cipher': cipher,
+        'size': size,
+        'file': file,
+        'download': download,
+        'weight': weight,
+    }
+
+
+def build_mix(preset: str, ciphers, sizes=None) -> list:
+    if preset == 'text':
+        return [_scenario(c, s, 1) for c in ciphers for s in (sizes or ['64', '1K', '16K'])]
+    if preset == 'files':
+        return [_scenario(c, s, 1, file=True, download=True)
+                for c in ciphers for s in (sizes or ['1K', '1M'])]
+    if preset == 'mixed':
+        # sizes hanya untuk skenario teks; ukuran file dan upload besar tetap
+        mix = [_scenario(c, s, 10) for c in ciphers for s in (sizes or ['64', '1K'])]
+        mix += [_scenario(c, '16K', 2, file=True, download=True) for c in ciphers]
+        if 'super' in ciphers:
+            mix.append(_scenario('super', 'max-download', 0.05, file=True, download=True))
+        return mix
+    raise ValueError(f"Mix tidak dikenal: {preset}")
+
+
+def load_mix_file(path: str) -> list:
+    with open(path, encoding='utf-8') as fh:
+        raw = json.load(fh)
+    mix = []
+    for item in raw:
+        if item.get('cipher') not in CIPHERS:
+            raise ValueError(f"Cipher tidak dikenal di {path}: {item.get('cipher')}")
+        sc = _scenario(item['cipher'], str(item.get('size', '1K')), float(item.get('weight', 1)),
+                       file=bool(item.get('file', False)), download=bool(item.get('download', False)))
+        if 'name' in item:
+            sc['name'] = item['name']
+        mix.append(sc)
+    return mix
+
+
+def _payload(cipher: str, size: int, text: bool = False) -> bytes:
+    # huruf saja untuk cipher alfabet supaya ukuran input = ukuran yang diproses
+    if cipher in BINARY_SUPPORTED:
+        if text:
+            # field teks di-encode ulang server sebagai UTF-8; pakai ASCII supaya
+            # jumlah byte yang diproses tetap sama dengan size
+            return base64.b64encode(os.urandom(size))[:size]
+        return os.urandom(size)
+    pattern = b'THEQUICKBROWNFOXJUMPSOVERTHELAZYDOG'
+    return (pattern * (size // len(pattern) + 1))[:size]
+
+
+def _multipart(fields: dict, filename: str, content: bytes):
+    boundary = uuid.uuid4().hex
+    parts = []
+    for k, v in fields.items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{k}"\r\n\r\n{v}\r\n'.encode())
+    parts.append(
+        f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        f'Content-Type: application/octet-stream\r\n\r\n'.encode()
+    )
+    parts.append(content)
+    parts.append(f'\r\n--{boundary}--\r\n'.encode())
+    return b''.join(parts), f'multipart/form-data; boundary={boundary}'
+
+
+def _post(url: str, body: bytes, content_type: str, timeout: float):
+    req = urllib.request.Request(url, data=body, method='POST', headers={'Content-Type': content_type})
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as ex:
+        return ex.code, ex.read()
+
+
+def _describe(ex: Exception) -> str:
+    reason = getattr(ex, 'reason', None)
+    return f'{type(ex).__name__}: {reason}' if reason else type(ex).__name__
+
+
+def _prepare(scenario: dict) -> dict:
+    """Bangun body request sekali per skenario; dipakai ulang oleh semua client."""
+    cipher = scenario['cipher']
+    size = parse_size(scenario['size'])
+    data = _payload(cipher, size, text=not scenario['file'])
+    fields = dict(_FORM, cipher_type=cipher, operation='encrypt')
+    if scenario['file']:
+        ext = 'bin' if cipher in BINARY_SUPPORTED else 'txt'
+        body, ctype = _multipart(fields, f'load.{ext}', data)
+    else:
+        fields['text'] = data.decode('ascii')
+        body = urllib.parse.urlencode(fields).encode()
+        ctype = 'application/x-www-form-urlencoded'
+    return {'body': body, 'content_type': ctype, 'bytes': size}
+
+
+def _one(base_url: str, scenario: dict, prepared: dict, timeout: float) -> list:
+    """Satu iterasi skenario; kembalikan list (op, latency_s, ok, error)."""
+    out = []
+    t0 = time.perf_counter()
+    try:
+        status, raw = _post(base_url + '/encrypt', prepared['body'], prepared['content_type'], timeout)
+        payload = json.loads(raw) if status == 200 else None
+        ok = status == 200 and payload.get('success')
+        err = None if ok else f'HTTP {status}'
+    except Exception as ex:  # timeout, koneksi ditolak, JSON rusak
+        payload, ok, err = None, False, _describe(ex)
+    out.append(('encrypt', time.perf_counter() - t0, ok, err))
+
+    if ok and scenario['download']:
+        body = urllib.parse.urlencode({'data': payload['result'], 'filename': payload['filename']}).encode()
+        t0 = time.perf_counter()
+        try:
+            status, raw = _post(base_url + '/download', body, 'application/x-www-form-urlencoded', timeout)
+            # round-trip dianggap gagal jika isi file tidak sama dengan hasil /encrypt
+            ok = status == 200 and raw == base64.b64decode(payload['result'])
+            err = None if ok else (f'HTTP {status}' if status != 200 else 'mismatch')
+        except Exception as ex:
+            ok, err = False, _describe(ex)
+        out.append(('download', time.perf_counter() - t0, ok, err))
+    return out
+
+
+def percentile(values, pct: float):
+    if not values:
+        return None
+    s = sorted(values)
+    k = (len(s) - 1) * pct / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(s) - 1)
+    return s[lo] + (s[hi] - s[lo]) * (k - lo)
+
+
+def _stats(samples, window: float) -> dict:
+    """samples: (latency_s, ok, error, selesai_s); throughput hanya dari yang selesai dalam window."""
+    lat = [s[0] * 1000 for s in samples]
+    errors = sum(1 for s in samples if not s[1])
+    in_window = sum(1 for s in samples if s[3] <= window)
+    return {
+        'requests': len(samples),
+        'errors': errors,
+        'error_rate': round(errors / len(samples), 4) if samples else 0.0,
+        'requests_in_window': in_window,
+        'throughput_rps': round(in_window / window, 3) if window else None,
+        'latency_ms': {
+            'p50': _round(percentile(lat, 50)),
+            'p95': _round(percentile(lat, 95)),
+            'p99': _round(percentile(lat, 99)),
+            'mean': _round(sum(lat) / len(lat)) if lat else None,
+            'max': _round(max(lat)) if lat else None,
+        },
+    }
+
+
+def _round(v):
+    return None if v is None else round(v, 3)
+
+
+# ======= Server & RSS =======
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(port: int, workers: int, threads: int, warmup: bool, timeout: int):
+    try:
+        import gunicorn  # noqa: F401
+    except ImportError:
+        sys.exit("gunicorn belum terpasang: pip install gunicorn")
+    env = dict(os.environ, DAZ_WARMUP='1' if warmup else '')
+    cmd = [
+        sys.executable, '-m', 'gunicorn', 'app:app',
+        '--bind', f'127.0.0.1:{port}',
+        '--workers', str(workers),
+        '--threads', str(threads),
+        '--timeout', str(timeout),
+        '--log-level', 'warning',
+    ]
+    proc = subprocess.Popen(cmd, cwd=ROOT, env=env)
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            sys.exit(f"gunicorn berhenti dengan kode {proc.returncode}")
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/', timeout=1):
+                return proc
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.1)
+    proc.terminate()
+    sys.exit("gunicorn tidak siap dalam 30 detik")
+
+
+def stop_server(proc):
+    proc.send_signal(signal.SIGTERM)
+    try:
+        proc.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+def _proc_tree_rss(pid: int):
+    """Total RSS (byte) proses pid dan seluruh anaknya, atau None jika tidak bisa dibaca."""
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil is not None:
+        try:
+            root = psutil.Process(pid)
+            procs = [root] + root.children(recursive=True)
+            return sum(p.memory_info().rss for p in procs if p.is_running())
+        except psutil.Error:
+            return None
+    if not os.path.isdir('/proc'):
+        return None
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as fh:
+                # field ke-4 adalah ppid; nama proses (field 2) bisa berisi spasi
+                ppid = int(fh.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    total, stack = 0, [pid]
+    while stack:
+        p = stack.pop()
+        stack.extend(children.get(p, []))
+        try:
+            with open(f'/proc/{p}/status') as fh:
+                for line in fh:
+                    if line.startswith('VmRSS:'):
+                        total += int(line.split()[1]) * 1024
+                        break
+        except OSError:
+            continue
+    return total
+
+
+class RssSampler(threading.Thread):
+    def __init__(self, pid: int, interval: float):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.samples = []
+        self._stop_event = threading.Event()
+        self._t0 = time.perf_counter()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            rss = _proc_tree_rss(self.pid)
+            if rss is not None:
+                self.samples.append({'t': round(time.perf_counter() - self._t0, 3), 'rss_bytes': rss})
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+# ======= Runner =======
+def run_load(base_url: str, mix: list, concurrency: int, duration: float,
+             max_requests, timeout: float, seed: int) -> tuple:
+    # hasil disimpan per indeks mix (bukan per nama) supaya entri dengan nama
+    # sama tetap dihitung terpisah
+    prepared = [_prepare(sc) for sc in mix]
+    indices = list(range(len(mix)))
+    weights = [sc['weight'] for sc in mix]
+    results = [{'encrypt': [], 'download': []} for _ in mix]
+    lock = threading.Lock()
+    issued = [0]
+    t0 = time.perf_counter()
+    deadline = t0 + duration
+
+    def client(idx: int):
+        rng = random.Random(seed + idx)
+        while time.perf_counter() < deadline:
+            with lock:
+                if max_requests is not None and issued[0] >= max_requests:
+                    return
+                issued[0] += 1
+            i = rng.choices(indices, weights=weights)[0]
+            for op, latency, ok, err in _one(base_url, mix[i], prepared[i], timeout):
+                done = time.perf_counter() - t0
+                with lock:
+                    results[i][op].append((latency, ok, err, done))
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results, time.perf_counter() - t0, prepared
+
+
+def build_report(args, mix, results, elapsed, prepared, rss_samples) -> dict:
+    # throughput dihitung atas jendela beban saja; request besar yang masih
+    # berjalan setelah --duration habis dilaporkan terpisah sebagai drain_s
+    window = min(elapsed, args.duration)
+    all_samples = []
+    scenarios = []
+    uploaded = 0
+    for sc, r, prep in zip(mix, results, prepared):
+        all_samples += r['encrypt'] + r['download']
+        uploaded += sum(1 for s in r['encrypt'] if s[3] <= window) * prep['bytes']
+        entry = dict(sc, bytes=prep['bytes'], encrypt=_stats(r['encrypt'], window))
+        if sc['download']:
+            entry['download'] = _stats(r['download'], window)
+        errors = {}
+        for _, ok, err, _ in r['encrypt'] + r['download']:
+            if not ok:
+                errors[err] = errors.get(err, 0) + 1
+        entry['error_kinds'] = errors
+        scenarios.append(entry)
+
+    summary = _stats(all_samples, window)
+    summary['duration_s'] = round(window, 3)
+    summary['drain_s'] = round(elapsed - window, 3)
+    summary['elapsed_s'] = round(elapsed, 3)
+    summary['input_mb_per_s'] = round(uploaded / window / 1024 ** 2, 3) if window else None
+    rss_values = [s['rss_bytes'] for s in rss_samples]
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'git_rev': _git_rev(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'mem_total_bytes': _mem_total(),
+            'server': {'wsgi': 'gunicorn', 'workers': args.workers, 'threads': args.threads,
+                       'warmup': args.warmup},
+            'load': {'concurrency': args.concurrency, 'duration_s': args.duration,
+                     'max_requests': args.requests, 'seed': args.seed},
+        },
+        'summary': summary,
+        'scenarios': scenarios,
+        'rss': {
+            'interval_s': args.rss_interval,
+            'peak_bytes': max(rss_values) if rss_values else None,
+            'samples': rss_samples,
+        },
+    }
+
+
+def _git_rev():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _mem_total():
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def _print_summary(report: dict):
+    s = report['summary']
+    lat = s['latency_ms']
+    peak = report['rss']['peak_bytes']
+    rss = f"RSS puncak {peak / 1024 ** 2:.1f} MB" if peak else "RSS tidak tersedia"
+    print(f"{s['requests']} request dalam {s['duration_s']} s (+{s['drain_s']} s drain): {s['throughput_rps']} req/s, "
+          f"error {s['error_rate'] * 100:.2f}%, p50/p95/p99 {lat['p50']}/{lat['p95']}/{lat['p99']} ms, {rss}",
+          file=sys.stderr)
+    rows = [(f"{sc['name']} {op}", sc[op]) for sc in report['scenarios']
+            for op in ('encrypt', 'download') if sc.get(op) and sc[op]['requests']]
+    width = max([len('skenario')] + [len(name) for name, _ in rows]) + 2
+    print(f"{'skenario':<{width}}{'n':>6}{'err':>6}{'p50 ms':>11}{'p95 ms':>11}{'p99 ms':>11}", file=sys.stderr)
+    for name, st in rows:
+        l = st['latency_ms']
+        print(f"{name:<{width}}{st['requests']:>6}{st['errors']:>6}"
+              f"{l['p50']:>11.1f}{l['p95']:>11.1f}{l['p99']:>11.1f}", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--mix', choices=['mixed', 'text', 'files'], default='mixed',
+                        help='preset traffic (default: mixed)')
+    parser.add_argument('--mix-file', help='file JSON berisi list skenario (menggantikan --mix)')
+    parser.add_argument('--cipher', action='append', choices=CIPHERS,
+                        help='batasi preset ke cipher ini (bisa diulang); default semua')
+    parser.add_argument('--sizes', help='ukuran input preset, dipisah koma, mis. 64,1K,1M,max; '
+                        'untuk mixed hanya skenario teks (file 16K dan upload super '
+                        'max-download tetap)')
+    parser.add_argument('--concurrency', type=int, default=8, help='jumlah client paralel')
+    parser.add_argument('--duration', type=float, default=30.0, help='lama pengiriman request (detik)')
+    parser.add_argument('--requests', type=int, help='batas jumlah iterasi skenario (opsional)')
+    parser.add_argument('--workers', type=int, default=2, help='gunicorn --workers')
+    parser.add_argument('--threads', type=int, default=1, help='gunicorn --threads')
+    parser.add_argument('--warmup', action='store_true', help='jalankan server dengan DAZ_WARMUP=1')
+    parser.add_argument('--timeout', type=float, default=600.0,
+                        help='timeout per request dan gunicorn --timeout (detik)')
+    parser.add_argument('--rss-interval', type=float, default=0.5, help='interval sampling RSS (detik)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--url', help='pakai server yang sudah jalan, tanpa start gunicorn (RSS dilewati)')
+    parser.add_argument('-o', '--output', help='tulis laporan JSON ke file (default: stdout)')
+    args = parser.parse_args(argv)
+
+    if args.mix_file:
+        mix = load_mix_file(args.mix_file)
+    else:
+        sizes = [s.strip() for s in args.sizes.split(',')] if args.sizes else None
+        mix = build_mix(args.mix, args.cipher or CIPHERS, sizes)
+
+    proc = None
+    sampler = None
+    if args.url:
+        base_url = args.url.rstrip('/')
+    else:
+        port = _free_port()
+        proc = start_server(port, args.workers, args.threads, args.warmup, int(args.timeout))
+        base_url = f'http://127.0.0.1:{port}'
+        sampler = RssSampler(proc.pid, args.rss_interval)
+        sampler.start()
+    try:
+        results, elapsed, prepared = run_load(base_url, mix, args.concurrency, args.duration,
+                                              args.requests, args.timeout, args.seed)
+    finally:
+        if sampler is not None:
+            sampler.stop()
+        if proc is not None:
+            stop_server(proc)
+
+    report = build_report(args, mix, results, elapsed, prepared, sampler.samples if sampler else [])
+    _print_summary(report)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as fh:
+            fh.write(text + '\n')
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark cold start: waktu dari interpreter baru sampai response pertama /encrypt.
+
+Setiap sampel dijalankan di proses Python baru supaya cache import tidak terbawa.
+Yang diukur per cipher:
+  - import   : ``import app`` (membuat Flask app lewat create_app)
+  - first    : request /encrypt pertama (termasuk lazy import engine)
+  - total    : import + first, yaitu time-to-first-response
+Dengan ``--warmup`` app dibuat dengan DAZ_WARMUP=1 sehingga biaya engine pindah
+ke fase import dan request pertama seharusnya sudah "panas".
+
+Contoh:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 10 --warmup --json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CIPHERS = ['vigenere', 'autokey', 'playfair', 'affine', 'hill', 'extended_vigenere', 'super']
+
+_CHILD = r'''
+import json, sys, time
+t0 = time.perf_counter()
+import app
+t1 = time.perf_counter()
+client = app.app.test_client()
+resp = client.post('/encrypt', data={
+    'cipher_type': sys.argv[1], 'operation': 'encrypt',
+    'text': 'hello world', 'key': 'KEY', 'key2': 'ab',
+})
+t2 = time.perf_counter()
+assert resp.status_code == 200, resp.get_data(as_text=True)
+print(json.dumps({'import': t1 - t0, 'first': t2 - t1, 'total': t2 - t0,
+                  'numpy_loaded': 'numpy' in sys.modules}))
+'''
+
+
+def _sample(cipher_type: str, warmup: bool) -> dict:
+    env = dict(os.environ)
+    env['DAZ_WARMUP'] = '1' if warmup else ''
+    out = subprocess.run(
+        [sys.executable, '-c', _CHILD, cipher_type],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def run(ciphers, runs: int, warmup: bool) -> list:
+    results = []
+    for cipher_type in ciphers:
+        samples = [_sample(cipher_type, warmup) for _ in range(runs)]
+        row = {'cipher': cipher_type, 'warmup': warmup, 'runs': runs,
+               'numpy_loaded': samples[-1]['numpy_loaded']}
+        for phase in ('import', 'first', 'total'):
+            values = [s[phase] * 1000 for s in samples]
+            row[f'{phase}_ms_median'] = round(statistics.median(values), 2)
+            row[f'{phase}_ms_min'] = round(min(values), 2)
+        results.append(row)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help='jumlah proses baru per cipher')
+    parser.add_argument('--cipher', action='append', choices=CIPHERS,
+                        help='cipher yang diukur (bisa diulang); default semua')
+    parser.add_argument('--warmup', action='store_true', help='jalankan dengan DAZ_WARMUP=1')
+    parser.add_argument('--json', action='store_true', help='output JSON')
+    args = parser.parse_args(argv)
+
+    results = run(args.cipher or CIPHERS, args.runs, args.warmup)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'cipher':<18}{'import ms':>11}{'first ms':>11}{'total ms':>11}  numpy")
+    for row in results:
+        print(f"{row['cipher']:<18}{row['import_ms_median']:>11.2f}{row['first_ms_median']:>11.2f}"
+              f"{row['total_ms_median']:>11.2f}  {'ya' if row['numpy_loaded'] else '-'}")
+
+
+if __name__ == '__main__':
+    main()
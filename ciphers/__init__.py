@@ -0,0 +1,116 @@
+"""
+Paket cipher dengan lazy loading.
+
+Setiap engine berada di modulnya sendiri dan baru di-import saat fungsi
+pertamanya diakses (``ciphers.hill_encrypt(...)``), sehingga dependensi berat
+seperti NumPy tidak ikut dimuat saat worker start kecuali Hill dipakai.
+"""
+import importlib
+
+# nama fungsi publik -> submodul yang mengimplementasikannya
+_EXPORTS = {
+    'clean_alpha': 'common',
+    'mod_inverse': 'common',
+    'vigenere_encrypt': 'classic',
+    'vigenere_decrypt': 'classic',
+    'autokey_encrypt': 'classic',
+    'autokey_decrypt': 'classic',
+    'affine_encrypt': 'classic',
+    'affine_decrypt': 'classic',
+    'playfair_encrypt': 'playfair',
+    'playfair_decrypt': 'playfair',
+    'hill_encrypt': 'hill',
+    'hill_decrypt': 'hill',
+    'parse_hill_matrix': 'hill',
+    'matrix_mod_inverse': 'hill',
+    'extended_vigenere_encrypt': 'binary',
+    'extended_vigenere_decrypt': 'binary',
+    'columnar_transpose_with_length_prefix': 'binary',
+    'columnar_untranspose_with_length_prefix': 'binary',
+}
+
+# cipher_type (nilai form) -> submodul engine
+ENGINES = {
+    'vigenere': 'classic',
+    'autokey': 'classic',
+    'affine': 'classic',
+    'playfair': 'playfair',
+    'hill': 'hill',
+    # belum punya engine sendiri; routes memakai fallback Vigenere
+    'enigma': 'classic',
+    'extended_vigenere': 'binary',
+    'super': 'binary',
+}
+
+__all__ = sorted(_EXPORTS) + ['ENGINES', 'load', 'warm_up']
+
+
+def load(cipher_type: str):
+    """Import (sekali saja) dan kembalikan modul engine untuk ``cipher_type``."""
+    if cipher_type not in ENGINES:
+        raise ValueError(f"Cipher tidak dikenal: {cipher_type}")
+    return importlib.import_module(f'.{ENGINES[cipher_type]}', __name__)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f'.{_EXPORTS[name]}', __name__)
+    value = getattr(module, name)
+    # simpan di namespace paket supaya akses berikutnya tidak lewat __getattr__
+    globals()[name] = value
+    return value
+
+
+def _warm_classic():
+    m = load('vigenere')
+    for enc, dec in ((m.vigenere_encrypt, m.vigenere_decrypt), (m.autokey_encrypt, m.autokey_decrypt)):
+        dec(enc("warmup", "KEY"), "KEY")
+    m.affine_decrypt(m.affine_encrypt("warmup", 5, 8), 5, 8)
+
+
+def _warm_playfair():
+    m = load('playfair')
+    m.playfair_decrypt(m.playfair_encrypt("warmup", "KEY"), "KEY")
+
+
+def _warm_hill():
+    # memicu inisialisasi lazy NumPy (linalg/BLAS) sebelum request pertama
+    m = load('hill')
+    matrix = m.parse_hill_matrix()
+    m.hill_decrypt(m.hill_encrypt("warmup", matrix), matrix)
+
+
+def _warm_binary():
+    m = load('super')
+    ev = m.extended_vigenere_encrypt(b"warmup", "key")
+    m.extended_vigenere_decrypt(m.columnar_untranspose_with_length_prefix(
+        m.columnar_transpose_with_length_prefix(ev, "key2"), "key2"), "key")
+
+
+_WARMERS = {
+    'classic': _warm_classic,
+    'playfair': _warm_playfair,
+    'hill': _warm_hill,
+    'binary': _warm_binary,
+}
+
+
+def warm_up(cipher_types=None):
+    """
+    Muat engine lebih awal dan jalankan satu round-trip kecil di tiap engine,
+    supaya biaya import dan inisialisasi pertama tidak jatuh ke request user.
+    Mengembalikan daftar submodul yang sudah dipanaskan.
+    """
+    if cipher_types is None:
+        cipher_types = list(ENGINES)
+    modules = []
+    for cipher_type in cipher_types:
+        module_name = ENGINES.get(cipher_type)
+        if module_name is None:
+            raise ValueError(f"Cipher tidak dikenal: {cipher_type}")
+        if module_name not in modules:
+            modules.append(module_name)
+    for module_name in modules:
+        _WARMERS[module_name]()
+    return modules
@@ -0,0 +1,73 @@
+"""Cipher byte-wise: Extended Vigenere dan transposisi kolom untuk Super cipher."""
+
+def extended_vigenere_encrypt(data: bytes, key: str) -> bytes:
+    if not key:
+        raise ValueError("Kunci tidak boleh kosong untuk Extended Vigenere.")
+    key_b = key.encode('utf-8')
+    out = bytearray()
+    for i, b in enumerate(data):
+        out.append((b + key_b[i % len(key_b)]) % 256)
+    return bytes(out)
+
+def extended_vigenere_decrypt(data: bytes, key: str) -> bytes:
+    if not key:
+        raise ValueError("Kunci tidak boleh kosong untuk Extended Vigenere.")
+    key_b = key.encode('utf-8')
+    out = bytearray()
+    for i, b in enumerate(data):
+        out.append((b - key_b[i % len(key_b)]) % 256)
+    return bytes(out)
+
+def _column_order(key: str):
+    # return list of column indices in order of reading (stable sort)
+    return sorted(range(len(key)), key=lambda i: (key[i], i))
+
+def columnar_transpose_with_length_prefix(data: bytes, key: str) -> bytes:
+    """
+    Prefix 8-byte length, then do columnar transposition.
+    """
+    if not key:
+        raise ValueError("Kunci transposisi (key2) tidak boleh kosong untuk Super cipher.")
+    prefix = len(data).to_bytes(8, 'big')
+    payload = prefix + data
+    cols = len(key)
+    rows = (len(payload) + cols - 1) // cols
+    pad_len = rows * cols - len(payload)
+    payload_padded = payload + b'\x00' * pad_len
+    # build matrix rows x cols
+    matrix = [payload_padded[i*cols:(i+1)*cols] for i in range(rows)]
+    order = _column_order(key)
+    out = bytearray()
+    for col in order:
+        for r in range(rows):
+            out.append(matrix[r][col])
+    return bytes(out)
+
+def columnar_untranspose_with_length_prefix(data: bytes, key: str) -> bytes:
+    """
+    Reverse of above. Returns original payload (without padding).
+    """
+    if not key:
+        raise ValueError("Kunci transposisi (key2) tidak boleh kosong untuk Super cipher.")
+    cols = len(key)
+    if len(data) % cols != 0:
+        raise ValueError("Data length is not a multiple of key length during untranspose.")
+    rows = len(data) // cols
+    order = _column_order(key)
+    # create empty matrix
+    matrix = [bytearray(cols) for _ in range(rows)]
+    idx = 0
+    for col in order:
+        for r in range(rows):
+            matrix[r][col] = data[idx]
+            idx += 1
+    # read row-wise
+    payload_padded = bytearray()
+    for r in range(rows):
+        payload_padded.extend(matrix[r])
+    # first 8 bytes are length
+    if len(payload_padded) < 8:
+        raise ValueError("Payload too short when reversing transposition.")
+    orig_len = int.from_bytes(bytes(payload_padded[:8]), 'big')
+    payload = bytes(payload_padded[8:8+orig_len])
+    return payload
@@ -0,0 +1,84 @@
+"""Cipher alfabet klasik: Vigenere, Auto-Key Vigenere dan Affine."""
+from math import gcd
+
+from .common import clean_alpha, mod_inverse
+
+def vigenere_encrypt(text: str, key: str) -> str:
+    txt = clean_alpha(text)
+    k = clean_alpha(key)
+    if not txt:
+        return ""
+    if not k:
+        raise ValueError("Kunci harus berisi huruf A-Z untuk Vigenere.")
+    res = []
+    for i, ch in enumerate(txt):
+        ki = k[i % len(k)]
+        enc = ((ord(ch) - 65 + (ord(ki) - 65)) % 26) + 65
+        res.append(chr(enc))
+    return ''.join(res).lower()
+
+def vigenere_decrypt(text: str, key: str) -> str:
+    txt = clean_alpha(text)
+    k = clean_alpha(key)
+    if not txt:
+        return ""
+    if not k:
+        raise ValueError("Kunci harus berisi huruf A-Z untuk Vigenere.")
+    res = []
+    for i, ch in enumerate(txt):
+        ki = k[i % len(k)]
+        dec = ((ord(ch) - 65 - (ord(ki) - 65)) % 26) + 65
+        res.append(chr(dec))
+    return ''.join(res).lower()
+
+def autokey_encrypt(text: str, key: str) -> str:
+    txt = clean_alpha(text)
+    k = clean_alpha(key)
+    if not txt:
+        return ""
+    if not k:
+        raise ValueError("Kunci harus berisi huruf A-Z untuk Autokey Vigenere.")
+    keystream = (k + txt)
+    res = []
+    for i, ch in enumerate(txt):
+        ks = keystream[i]
+        enc = ((ord(ch) - 65 + (ord(ks) - 65)) % 26) + 65
+        res.append(chr(enc))
+    return ''.join(res).lower()
+
+def autokey_decrypt(text: str, key: str) -> str:
+    ctext = clean_alpha(text)
+    k = clean_alpha(key)
+    if not ctext:
+        return ""
+    if not k:
+        raise ValueError("Kunci harus berisi huruf A–Z untuk Autokey Vigenere.")
+    keystream = list(k)
+    plaintext_chars = []
+    for i, ch in enumerate(ctext):
+        ks = keystream[i]
+        dec_val = ((ord(ch) - 65) - (ord(ks) - 65)) % 26
+        pch = chr(dec_val + 65)
+        plaintext_chars.append(pch)
+        keystream.append(pch)
+    return ''.join(plaintext_chars).lower()
+
+def affine_encrypt(text: str, a: int, b: int) -> str:
+    txt = clean_alpha(text)
+    if gcd(a, 26) != 1:
+        return "Error: a dan 26 tidak coprime"
+    res = []
+    for ch in txt:
+        res.append(chr(((a * (ord(ch) - 65) + b) % 26) + 65))
+    return ''.join(res).lower()
+
+def affine_decrypt(text: str, a: int, b: int) -> str:
+    txt = clean_alpha(text)
+    if gcd(a, 26) != 1:
+        return "Error: a dan 26 tidak coprime"
+    a_inv = mod_inverse(a, 26)
+    res = []
+    for ch in txt:
+        dec = (a_inv * ((ord(ch) - 65) - b)) % 26
+        res.append(chr(dec + 65))
+    return ''.join(res).lower()
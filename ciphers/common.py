@@ -0,0 +1,13 @@
+"""Helper umum yang dipakai beberapa cipher (tanpa dependensi berat)."""
+
+def mod_inverse(a: int, m: int):
+    a = a % m
+    for x in range(1, m):
+        if (a * x) % m == 1:
+            return x
+    return None
+
+def clean_alpha(s: str) -> str:
+    if s is None:
+        return ""
+    return ''.join([c for c in s.upper() if c.isalpha()])
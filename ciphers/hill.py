@@ -0,0 +1,51 @@
+"""Hill cipher. Satu-satunya engine yang membutuhkan NumPy."""
+import json
+
+import numpy as np
+
+from .common import clean_alpha, mod_inverse
+
+DEFAULT_MATRIX = '[[6,24,1],[13,16,10],[20,17,15]]'
+
+def matrix_mod_inverse(matrix, mod):
+    det = int(round(np.linalg.det(matrix)))
+    det_mod = det % mod
+    det_inv = mod_inverse(det_mod, mod)
+    if det_inv is None:
+        return None
+    cof = np.round(det * np.linalg.inv(matrix)).astype(int)
+    inv_matrix = (det_inv * cof) % mod
+    return inv_matrix
+
+def parse_hill_matrix(raw=None) -> np.ndarray:
+    # raw adalah string JSON dari form, mis. "[[6,24,1],[13,16,10],[20,17,15]]"
+    if raw is None:
+        raw = DEFAULT_MATRIX
+    return np.array(json.loads(raw))
+
+def hill_encrypt(text: str, matrix) -> str:
+    txt = clean_alpha(text)
+    n = len(matrix)
+    if n == 0:
+        return ""
+    while len(txt) % n != 0:
+        txt += "X"
+    result = []
+    for i in range(0, len(txt), n):
+        block = np.array([ord(ch) - 65 for ch in txt[i:i+n]])
+        enc = np.dot(matrix, block) % 26
+        result += [chr(int(x) + 65) for x in enc]
+    return ''.join(result).lower()
+
+def hill_decrypt(text: str, matrix) -> str:
+    txt = clean_alpha(text)
+    inv_matrix = matrix_mod_inverse(matrix, 26)
+    if inv_matrix is None:
+        return "Error: matriks tidak invertibel"
+    n = len(matrix)
+    result = []
+    for i in range(0, len(txt), n):
+        block = np.array([ord(ch) - 65 for ch in txt[i:i+n]])
+        dec = np.dot(inv_matrix, block) % 26
+        result += [chr(int(x) + 65) for x in dec]
+    return ''.join(result).lower()
@@ -0,0 +1,95 @@
+"""Playfair cipher (kotak 5x5, J digabung ke I)."""
+from .common import clean_alpha
+
+def _build_playfair_square(key: str):
+    key = clean_alpha(key).upper().replace('J', 'I')
+    seen = set()
+    square = []
+    for ch in key:
+        if ch not in seen:
+            seen.add(ch)
+            square.append(ch)
+    for ch in "ABCDEFGHIKLMNOPQRSTUVWXYZ":
+        if ch not in seen:
+            seen.add(ch)
+            square.append(ch)
+    pos = {}
+    for idx, ch in enumerate(square):
+        r, c = divmod(idx, 5)
+        pos[ch] = (r, c)
+    return square, pos
+
+def _prepare_playfair_plaintext(text: str):
+    s = clean_alpha(text).upper().replace('J', 'I')
+    pairs = []
+    i = 0
+    while i < len(s):
+        a = s[i]
+        b = s[i+1] if i+1 < len(s) else None
+        if b is None:
+            pairs.append(a + 'X')
+            i += 1
+        elif a == b:
+            pairs.append(a + 'X')
+            i += 1
+        else:
+            pairs.append(a + b)
+            i += 2
+    return pairs
+
+def playfair_encrypt(text: str, key: str) -> str:
+    square, pos = _build_playfair_square(key)
+    pairs = _prepare_playfair_plaintext(text)
+    cipher_pairs = []
+    for pair in pairs:
+        a, b = pair[0], pair[1]
+        ra, ca = pos[a]
+        rb, cb = pos[b]
+        if ra == rb:
+            ca2 = (ca + 1) % 5
+            cb2 = (cb + 1) % 5
+            cipher_pairs.append(square[ra*5 + ca2] + square[rb*5 + cb2])
+        elif ca == cb:
+            ra2 = (ra + 1) % 5
+            rb2 = (rb + 1) % 5
+            cipher_pairs.append(square[ra2*5 + ca] + square[rb2*5 + cb])
+        else:
+            cipher_pairs.append(square[ra*5 + cb] + square[rb*5 + ca])
+    return ''.join(cipher_pairs).lower()
+
+def playfair_decrypt(text: str, key: str) -> str:
+    s = clean_alpha(text).upper()
+    if len(s) % 2 == 1:
+        s += 'X'
+    square, pos = _build_playfair_square(key)
+    plain_pairs = []
+    for i in range(0, len(s), 2):
+        a = s[i]
+        b = s[i+1]
+        ra, ca = pos[a]
+        rb, cb = pos[b]
+        if ra == rb:
+            ca2 = (ca - 1) % 5
+            cb2 = (cb - 1) % 5
+            plain_pairs.append(square[ra*5 + ca2] + square[rb*5 + cb2])
+        elif ca == cb:
+            ra2 = (ra - 1) % 5
+            rb2 = (rb - 1) % 5
+            plain_pairs.append(square[ra2*5 + ca] + square[rb2*5 + cb])
+        else:
+            plain_pairs.append(square[ra*5 + cb] + square[rb*5 + ca])
+    plain = ''.join(plain_pairs)
+    # heuristik remove filler 'X' between identical letters and trailing X
+    cleaned = []
+    i = 0
+    while i < len(plain):
+        if i+2 < len(plain) and plain[i] == plain[i+2] and plain[i+1] == 'X':
+            cleaned.append(plain[i])
+            i += 2
+        else:
+            cleaned.append(plain[i])
+            i += 1
+    result = ''.join(cleaned)
+    if result.endswith('X'):
+        result = result[:-1]
+    return result.lower()
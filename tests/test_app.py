@@ -0,0 +1,78 @@
+import logging
+import os
+import subprocess
+import sys
+
+import pytest
+
+from app import create_app
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_warmup_disabled_values():
+    for value in ('0', 'false', 'No', 'OFF', ''):
+        app = create_app({'WARMUP': value})
+        assert app.test_client().get('/').status_code == 200
+
+
+def test_warmup_skips_unknown_cipher_names():
+    # proses baru supaya import hill sebelumnya tidak ikut terhitung
+    code = (
+        "import sys\n"
+        "import app\n"
+        "assert 'ciphers.hill' not in sys.modules\n"
+        "warmed = app.create_app({'WARMUP': 'hill,bogus'})\n"
+        "assert 'ciphers.hill' in sys.modules\n"
+        "assert warmed.test_client().get('/').status_code == 200\n"
+    )
+    env = dict(os.environ, DAZ_WARMUP='')
+    subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=env, check=True)
+
+
+def test_warmup_logs_unknown_cipher_names(caplog):
+    with caplog.at_level(logging.WARNING):
+        create_app({'WARMUP': 'vigenere,bogus,enigma'})
+    messages = [r.getMessage() for r in caplog.records if r.levelno == logging.WARNING]
+    assert any('bogus' in m for m in messages), messages
+    assert not any('enigma' in m for m in messages), messages
+
+
+def test_numpy_loaded_only_on_first_hill_request():
+    code = (
+        "import sys\n"
+        "import app\n"
+        "assert 'numpy' not in sys.modules, 'numpy dimuat saat import app'\n"
+        "resp = app.app.test_client().post('/encrypt', data={\n"
+        "    'cipher_type': 'hill', 'operation': 'encrypt', 'text': 'hello'})\n"
+        "assert resp.status_code == 200\n"
+        "assert 'numpy' in sys.modules\n"
+    )
+    env = dict(os.environ, DAZ_WARMUP='')
+    subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=env, check=True)
+
+
+@pytest.mark.parametrize('cipher_type, expected', [
+    ('vigenere', 'helloworld'),
+    ('autokey', 'helloworld'),
+    ('playfair', 'helloworld'),
+    ('affine', 'helloworld'),
+    ('hill', 'helloworldxx'),
+    ('extended_vigenere', 'hello world'),
+    ('super', 'hello world'),
+])
+def test_encrypt_decrypt_round_trip(cipher_type, expected):
+    client = create_app({'WARMUP': ''}).test_client()
+    form = {'cipher_type': cipher_type, 'key': 'KEY', 'key2': 'ab'}
+    enc = client.post('/encrypt', data=dict(form, operation='encrypt', text='hello world')).get_json()
+    assert enc['success'], enc
+    dec = client.post('/encrypt', data=dict(form, operation='decrypt', text=enc['result_text'])).get_json()
+    assert dec['success'], dec
+    assert dec['result_text'] == expected
+
+
+def test_engine_names_match_accepted_cipher_types():
+    import ciphers
+    from app import BINARY_SUPPORTED, LETTER_ONLY_CIPHERS
+
+    assert set(ciphers.ENGINES) == LETTER_ONLY_CIPHERS | BINARY_SUPPORTED